@@ -6,23 +6,37 @@ placements based on expected resource production.
 
 Main classes:
     - HexTile: Represents a hex tile (resource + number)
+    - Resource: Integer codes for resource types
     - Settlement: Represents a settlement/city with analysis methods
 
+Functions:
+    - make_settlement: Shared settlement for a combination of hexes
+    - score_settlements_bulk: Expected resources for many settlements at once
+    - score_from_arrays: All three metrics from dice numbers and resource codes
+
 Constants:
     - ROLL_PROBABILITIES: 2d6 dice probability distribution
+    - ROLL_PROB_TABLE: Same distribution as a tuple indexed by dice number
 """
 
 __version__ = '0.1.0'
 __author__ = 'Domingo Salerno'
 
 # Import main classes and constants for easy access
-from catan_tracker.probabilities import ROLL_PROBABILITIES
-from catan_tracker.hex_tile import HexTile
-from catan_tracker.settlement import Settlement
+from catan_tracker.probabilities import ROLL_PROBABILITIES, ROLL_PROB_TABLE
+from catan_tracker.hex_tile import HexTile, Resource
+from catan_tracker.settlement import (
+    Settlement, make_settlement, score_settlements_bulk, score_from_arrays
+)
 
 # Define what's exported when someone does: from catan_tracker import *
 __all__ = [
     'ROLL_PROBABILITIES',
+    'ROLL_PROB_TABLE',
     'HexTile',
+    'Resource',
     'Settlement',
+    'make_settlement',
+    'score_settlements_bulk',
+    'score_from_arrays',
 ]
\ No newline at end of file
@@ -5,20 +5,80 @@ A hex tile has a resource type (wood, brick, sheep, wheat, ore, desert)
 and a dice number (2-12, or 0 for desert).
 """
 
+import sys
+from enum import IntEnum
+from catan_tracker.probabilities import ROLL_PROB_TABLE
+
+
+class Resource(IntEnum):
+    """Integer codes for resource types (desert is 0, so it is falsy)."""
+
+    DESERT = 0
+    WOOD = 1
+    BRICK = 2
+    SHEEP = 3
+    WHEAT = 4
+    ORE = 5
+
+
+# Lowercase resource name -> Resource code
+_NAME_TO_RESOURCE = {member.name.lower(): member for member in Resource}
+
+# Valid resource types, derived from Resource so the two can't drift apart
+VALID_RESOURCES = frozenset(_NAME_TO_RESOURCE)
+
+# Bit for each dice number in a mask of numbers 2-12, indexed by number.
+# 0 (desert) and 1 can't be rolled, so they have no bit.
+_NUMBER_BITS = (0, 0) + tuple(1 << (number - 2) for number in range(2, 13))
+
+# Bit for each resource in a mask of the five producing resources,
+# indexed by Resource code. Desert produces nothing, so it has no bit.
+_RESOURCE_BITS = (0,) + tuple(1 << (code - 1) for code in range(1, 6))
+
+# Bit n is set when n is a valid tile number: 0-12 except 7
+_VALID_NUMBER_MASK = sum(1 << number for number in range(13) if number != 7)
+
+# Shared tiles handed out by HexTile(), keyed on (lowercase resource, number)
+_HEX_CACHE = {}
+
 
 class HexTile:
-    """Represents a single hex tile on the Catan board."""
+    """
+    Represents a single hex tile on the Catan board.
+
+    Tiles are shared and immutable: constructing the same (resource, number)
+    twice returns the same instance, and assigning to a tile's attributes
+    raises AttributeError.
 
-    # Valid resource types
-    VALID_RESOURCES = {'wood', 'brick', 'sheep', 'wheat', 'ore', 'desert'}
+    Input is not validated when Python runs with -O, for simulations that
+    only build tiles from known-good data. Invalid input then gives
+    undefined results: it may raise an unrelated error, or be accepted and
+    cached like a valid tile (a 7 tile, for example, scores as 6/36).
+    """
 
-    def __init__(self, resource, number):
+    __slots__ = (
+        'resource',
+        'resource_id',
+        'resource_bit',
+        'number',
+        'number_bit',
+        'probability_value',
+    )
+
+    # Valid resource types (module constant, kept here for compatibility)
+    VALID_RESOURCES = VALID_RESOURCES
+
+    # Sorted list for error messages, built once instead of per failure
+    _VALID_RESOURCES_ERR = ', '.join(sorted(VALID_RESOURCES))
+
+    def __new__(cls, resource, number):
         """
-        Create a new hex tile.
+        Create a new hex tile, or return the shared one for these values.
 
         Args:
-            resource (str): Type of resource ('wood', 'brick', 'sheep',
-                           'wheat', 'ore', 'desert')
+            resource (str or Resource): Type of resource ('wood', 'brick',
+                           'sheep', 'wheat', 'ore', 'desert'), or the
+                           matching Resource member
             number (int): Dice number on the tile (2-12, or 0 for desert)
 
         Raises:
@@ -27,15 +87,91 @@ class HexTile:
         Examples:
             >>> wood_hex = HexTile('wood', 6)
             >>> desert = HexTile('desert', 0)
+            >>> ore_hex = HexTile(Resource.ORE, 8)
+            >>> HexTile('wood', 6) is HexTile('wood', 6)
+            True
+        """
+        # Convert to lowercase for case-insensitive comparison, skipping
+        # the copy when the name is already a plain lowercase str. Resource
+        # members map to their lowercase name. str subclasses always go
+        # through lower(), which returns a plain str that can be interned.
+        if type(resource) is not str or resource not in VALID_RESOURCES:
+            if type(resource) is Resource:
+                resource = resource.name.lower()
+            else:
+                resource = resource.lower()
+
+        # Repeat tiles skip validation entirely. The cache is keyed on the
+        # normalized name, so other spellings don't add entries. Only exact
+        # ints are cached, so 6.0 or True can't alias the tile for 6 or 1.
+        key = (resource, number)
+        cacheable = type(number) is int
+        if cacheable:
+            hex_tile = _HEX_CACHE.get(key)
+            if hex_tile is not None:
+                return hex_tile
+
+        # Fast path: the resource code lookup doubles as the resource check,
+        # and one shift tests the number against every valid number. Exact
+        # int type is required so floats and bools still go through the
+        # full checks.
+        resource_id = _NAME_TO_RESOURCE.get(resource)
+        if __debug__:
+            if (resource_id is None or not cacheable or number < 0
+                    or not (_VALID_NUMBER_MASK >> number) & 1):
+                cls._validate(resource, number)
+
+        # All valid, store the data
+        hex_tile = object.__new__(cls)
+        hex_tile._store(resource, resource_id, number)
+
+        if cacheable:
+            _HEX_CACHE[key] = hex_tile
+        return hex_tile
+
+    def __setattr__(self, name, value):
+        """Reject assignment, since tiles are shared between callers."""
+        raise AttributeError(f"HexTile is immutable, can't set '{name}'")
+
+    def __delattr__(self, name):
+        """Reject deletion, since tiles are shared between callers."""
+        raise AttributeError(f"HexTile is immutable, can't delete '{name}'")
+
+    def __reduce__(self):
+        """Rebuild copies and pickles through the constructor."""
+        return type(self), (self.resource, self.number)
+
+    def _store(self, resource, resource_id, number):
+        """Store a validated tile's data and its precomputed lookups."""
+        # __setattr__ blocks assignment, so write the slots directly
+        set_field = object.__setattr__
+        # Interning makes equal resource names share one string object
+        set_field(self, 'resource', sys.intern(resource))
+        set_field(self, 'resource_id', resource_id)
+        # Bit for this resource in a settlement's resource mask (0 for desert)
+        set_field(self, 'resource_bit', _RESOURCE_BITS[resource_id])
+        set_field(self, 'number', number)
+        # Bit for this number in a settlement's number mask (0 for desert)
+        set_field(self, 'number_bit', _NUMBER_BITS[number])
+        # Chance this tile's number is rolled (0.0 for desert)
+        set_field(self, 'probability_value', ROLL_PROB_TABLE[number])
+
+    @classmethod
+    def _validate(cls, resource, number):
         """
-        # Convert to lowercase for case-insensitive comparison
-        resource = resource.lower()
+        Raise a descriptive error for an invalid resource or number.
 
+        Only called when the fast-path checks fail, so the individual
+        checks don't cost anything for valid tiles.
+
+        Raises:
+            ValueError: If resource or number is invalid
+        """
         # Validate resource type
-        if resource not in self.VALID_RESOURCES:
+        if resource not in VALID_RESOURCES:
             raise ValueError(
                 f"Invalid resource '{resource}'. "
-                f"Must be one of: {', '.join(sorted(self.VALID_RESOURCES))}"
+                f"Must be one of: {cls._VALID_RESOURCES_ERR}"
             )
 
         # Validate number is an integer
@@ -52,9 +188,15 @@ class HexTile:
         if number == 7:
             raise ValueError("Number cannot be 7 (robber!)")
 
-        # All valid, store the data
-        self.resource = resource
-        self.number = number
+    def __eq__(self, other):
+        """Return True if other is a tile with the same resource and number."""
+        if not isinstance(other, HexTile):
+            return NotImplemented
+        return self.resource == other.resource and self.number == other.number
+
+    def __hash__(self):
+        """Return a hash based on resource and number."""
+        return hash((self.resource, self.number))
 
     def __repr__(self):
         """Return a string representation of this hex tile."""
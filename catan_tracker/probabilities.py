@@ -5,20 +5,32 @@ This module contains constants related to probability calculations
 for the game of Catan, specifically the 2d6 dice roll distribution.
 """
 
-# Dice roll probabilities for 2d6
-ROLL_PROBABILITIES = {
-    2: 1 / 36,  # 2.78%
-    3: 2 / 36,  # 5.56%
-    4: 3 / 36,  # 8.33%
-    5: 4 / 36,  # 11.11%
-    6: 5 / 36,  # 13.89%
-    7: 6 / 36,  # 16.67%
-    8: 5 / 36,  # 13.89%
-    9: 4 / 36,  # 11.11%
-    10: 3 / 36,  # 8.33%
-    11: 2 / 36,  # 5.56%
-    12: 1 / 36,  # 2.78%
-}
+from types import MappingProxyType
+
+# Dice roll probabilities for 2d6, indexed directly by dice number (0-12).
+# Numbers that can't be rolled (0 for desert, 1) map to 0.0, so callers
+# can index without a default or a desert check.
+ROLL_PROB_TABLE = (
+    0.0,     # 0 (desert)
+    0.0,     # 1
+    1 / 36,  # 2: 2.78%
+    2 / 36,  # 3: 5.56%
+    3 / 36,  # 4: 8.33%
+    4 / 36,  # 5: 11.11%
+    5 / 36,  # 6: 13.89%
+    6 / 36,  # 7: 16.67%
+    5 / 36,  # 8: 13.89%
+    4 / 36,  # 9: 11.11%
+    3 / 36,  # 10: 8.33%
+    2 / 36,  # 11: 5.56%
+    1 / 36,  # 12: 2.78%
+)
+
+# Same distribution keyed by the numbers that can be rolled (2-12),
+# read-only so it can't drift from the table
+ROLL_PROBABILITIES = MappingProxyType({
+    number: ROLL_PROB_TABLE[number] for number in range(2, 13)
+})
 
 
 def validate_probabilities():
@@ -34,8 +46,4 @@ def validate_probabilities():
     total = sum(ROLL_PROBABILITIES.values())
     if abs(total - 1.0) > 0.0001:
         raise ValueError(f"Probabilities sum to {total}, expected 1.0")
-    return True
-
-
-# Validate on import
-validate_probabilities()
\ No newline at end of file
+    return True
\ No newline at end of file
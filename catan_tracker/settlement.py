@@ -6,12 +6,99 @@ This module provides methods to calculate various metrics about settlement quali
 """
 
 import math
-from catan_tracker.probabilities import ROLL_PROBABILITIES
-from catan_tracker.hex_tile import HexTile
+import weakref
+from operator import attrgetter
+from catan_tracker.probabilities import ROLL_PROB_TABLE
+from catan_tracker.hex_tile import HexTile, _NUMBER_BITS, _RESOURCE_BITS
+
+# Diversity factor for every resource mask (see HexTile.resource_bit):
+# the square root of the number of distinct resources in the mask
+_DIVERSITY_BY_MASK = tuple(
+    math.sqrt(bin(mask).count('1')) for mask in range(1 << 5)
+)
+
+
+def _build_mask_table():
+    """
+    Build the probability of rolling any number in each number mask.
+
+    Bit 0 of a mask is number 2 and bit 10 is number 12 (see
+    HexTile.number_bit).
+
+    Returns:
+        tuple: 2^11 probabilities, indexed by mask
+    """
+    table = [0.0] * (1 << 11)
+    for mask in range(1, 1 << 11):
+        # Reuse the mask without its lowest bit, then add that bit's number
+        low_bit = mask & -mask
+        number = low_bit.bit_length() + 1
+        table[mask] = table[mask ^ low_bit] + ROLL_PROB_TABLE[number]
+    return tuple(table)
+
+
+_MASK_TO_PROB = _build_mask_table()
+
+# Reads .number off a tile in C when used with map()
+_get_number = attrgetter('number')
+
+# Reads the fields that decide a tile's contribution to the metrics
+_get_tile_key = attrgetter('number', 'resource_id')
+
+# Live settlements handed out by make_settlement(), keyed on their sorted
+# (number, resource code) pairs and city flag
+_SETTLEMENT_CACHE = weakref.WeakValueDictionary()
+
+
+# Unrolled folds over a settlement's 1, 2 or 3 hexes. Each returns
+# (probability sum, number mask, resource mask); OR-ing the bits dedupes
+# numbers and resources shared by several hexes.
+def _fold_1(a):
+    return (
+        a.probability_value,
+        a.number_bit,
+        a.resource_bit,
+    )
+
+
+def _fold_2(a, b):
+    return (
+        a.probability_value + b.probability_value,
+        a.number_bit | b.number_bit,
+        a.resource_bit | b.resource_bit,
+    )
+
+
+def _fold_3(a, b, c):
+    return (
+        a.probability_value + b.probability_value + c.probability_value,
+        a.number_bit | b.number_bit | c.number_bit,
+        a.resource_bit | b.resource_bit | c.resource_bit,
+    )
+
+
+# Fold for each hex count
+_FOLDS = (None, _fold_1, _fold_2, _fold_3)
 
 
 class Settlement:
-    """Represents a settlement or city placement in Catan."""
+    """
+    Represents a settlement or city placement in Catan.
+
+    Metrics are computed once at construction, so the hexes must not be
+    modified after the settlement is created. Input is not validated when
+    Python runs with -O, and invalid hexes then give undefined results.
+    """
+
+    __slots__ = (
+        'hexes',
+        'is_city',
+        'multiplier',
+        '_expected',
+        '_weighted',
+        '_prob_any',
+        '__weakref__',
+    )
 
     def __init__(self, hexes, is_city=False):
         """
@@ -30,6 +117,55 @@ class Settlement:
             >>> settlement = Settlement(hexes)
             >>> city = Settlement(hexes, is_city=True)
         """
+        if __debug__:
+            self._validate(hexes)
+
+        # All valid, store the data. A tuple keeps the hexes immutable,
+        # since the metrics are computed from them only once.
+        self._setup(tuple(hexes), is_city)
+
+    @classmethod
+    def _from_trusted(cls, hexes, is_city=False):
+        """
+        Create a settlement without validating its hexes.
+
+        For internal enumerators that build hex tuples they know are valid.
+
+        Args:
+            hexes (tuple): Tuple of 1-3 HexTile objects
+            is_city (bool): Whether this is a city (default: False)
+
+        Returns:
+            Settlement: New settlement
+        """
+        settlement = cls.__new__(cls)
+        settlement._setup(hexes, is_city)
+        return settlement
+
+    def _setup(self, hexes, is_city):
+        """Store validated hexes and compute the settlement's metrics."""
+        self.hexes = hexes
+        self.is_city = is_city
+        self.multiplier = 2 if is_city else 1
+
+        # Fold the hexes once with the fold for this hex count, collecting
+        # everything the metrics need. Desert hexes have probability 0.0
+        # and no number or resource bit.
+        total, number_mask, resource_mask = _FOLDS[len(hexes)](*hexes)
+
+        self._expected = total * self.multiplier
+        # Apply square root scaling for balanced weighting
+        self._weighted = self._expected * _DIVERSITY_BY_MASK[resource_mask]
+        self._prob_any = _MASK_TO_PROB[number_mask]
+
+    @staticmethod
+    def _validate(hexes):
+        """
+        Check that hexes is a list of 1-3 HexTile objects.
+
+        Raises:
+            ValueError: If hexes is invalid
+        """
         # Validate hexes is a list
         if not isinstance(hexes, list):
             raise ValueError(
@@ -42,18 +178,46 @@ class Settlement:
                 f"A settlement must touch 1-3 hexes, got {len(hexes)}"
             )
 
-        # Validate all items are HexTile objects
-        for i, hex_tile in enumerate(hexes):
-            if not isinstance(hex_tile, HexTile):
-                raise ValueError(
-                    f"All hexes must be HexTile objects. "
-                    f"Item {i} is {type(hex_tile).__name__}"
-                )
+        # Validate all items are HexTile objects, only looking for the
+        # offending index once we know there is one
+        if not all(type(hex_tile) is HexTile for hex_tile in hexes):
+            i, hex_tile = next(
+                (i, hex_tile)
+                for i, hex_tile in enumerate(hexes)
+                if type(hex_tile) is not HexTile
+            )
+            raise ValueError(
+                f"All hexes must be HexTile objects. "
+                f"Item {i} is {type(hex_tile).__name__}"
+            )
 
-        # All valid, store the data
-        self.hexes = hexes
-        self.is_city = is_city
-        self.multiplier = 2 if is_city else 1
+    @staticmethod
+    def to_array(settlements):
+        """
+        Stack settlements into rows of dice numbers for bulk scoring.
+
+        Each row holds the numbers of one settlement's hexes, padded with 0
+        (desert) up to 3 entries so every row has the same length.
+
+        Args:
+            settlements (list): Settlement objects to stack
+
+        Returns:
+            tuple: (hex_numbers, is_city) lists, ready to pass to
+                   score_settlements_bulk()
+
+        Example:
+            >>> settlement = Settlement([HexTile('wood', 6)])
+            >>> Settlement.to_array([settlement])
+            ([(6, 0, 0)], [False])
+        """
+        hex_numbers = []
+        is_city = []
+        for settlement in settlements:
+            numbers = tuple(map(_get_number, settlement.hexes))
+            hex_numbers.append(numbers + (0,) * (3 - len(numbers)))
+            is_city.append(settlement.is_city)
+        return hex_numbers, is_city
 
     def __repr__(self):
         """Return a string representation of this settlement."""
@@ -73,17 +237,7 @@ class Settlement:
             >>> settlement.expected_resources_per_roll()
             0.2778
         """
-        total = 0.0
-
-        for hex_tile in self.hexes:
-            # Skip desert hexes (number 0)
-            if hex_tile.number > 0:
-                # Get probability for this number
-                prob = ROLL_PROBABILITIES.get(hex_tile.number, 0)
-                # Add to total, accounting for city multiplier
-                total += prob * self.multiplier
-
-        return total
+        return self._expected
 
     def expected_resources_weighted_by_diversity(self):
         """
@@ -110,20 +264,7 @@ class Settlement:
             >>> settlement.expected_resources_weighted_by_diversity()
             0.6728
         """
-        # Get base expected resources per roll
-        base_expected = self.expected_resources_per_roll()
-
-        # Count unique resource types (excluding desert) using set comprehension
-        resource_types = {
-            hex_tile.resource
-            for hex_tile in self.hexes
-            if hex_tile.resource != 'desert'
-        }
-
-        # Apply square root scaling for balanced weighting
-        diversity_factor = math.sqrt(len(resource_types))
-
-        return base_expected * diversity_factor
+        return self._weighted
 
     def probability_of_resources_on_roll(self):
         """
@@ -147,17 +288,134 @@ class Settlement:
             >>> settlement.probability_of_resources_on_roll()
             0.3889
         """
-        # Collect unique dice numbers (excluding desert/0)
-        unique_numbers = {
-            hex_tile.number
-            for hex_tile in self.hexes
-            if hex_tile.number > 0
-        }
-
-        # Sum probabilities for all unique numbers
-        total_probability = sum(
-            ROLL_PROBABILITIES.get(number, 0)
-            for number in unique_numbers
+        return self._prob_any
+
+    def score(self):
+        """
+        Return all three settlement metrics at once.
+
+        Returns:
+            tuple: (expected_resources_per_roll,
+                    expected_resources_weighted_by_diversity,
+                    probability_of_resources_on_roll)
+
+        Example:
+            >>> hexes = [HexTile('wood', 6), HexTile('brick', 8)]
+            >>> settlement = Settlement(hexes)
+            >>> settlement.score()
+            (0.2778, 0.3928, 0.2778)
+        """
+        return self._expected, self._weighted, self._prob_any
+
+
+def make_settlement(hexes, is_city=False):
+    """
+    Return a shared settlement for this combination of hexes.
+
+    Settlements touching the same numbers and resources (in any order)
+    have identical metrics, so repeated placements can share one instance
+    while it is still referenced elsewhere. The shared settlement keeps the
+    hexes it was first created with. Settlement(...) still always builds a
+    new instance.
+
+    Args:
+        hexes (list): List of HexTile objects adjacent to this settlement
+                     (1-3 hexes)
+        is_city (bool): Whether this is a city (default: False)
+
+    Returns:
+        Settlement: Cached or newly created settlement
+
+    Raises:
+        ValueError: If hexes is invalid
+
+    Example:
+        >>> a = make_settlement([HexTile('wood', 6), HexTile('ore', 8)])
+        >>> b = make_settlement([HexTile('ore', 8), HexTile('wood', 6)])
+        >>> a is b
+        True
+    """
+    # Validate before the lookup, so the result doesn't depend on what is
+    # already cached
+    if __debug__:
+        Settlement._validate(hexes)
+
+    is_city = bool(is_city)
+    key = (tuple(sorted(map(_get_tile_key, hexes))), is_city)
+    settlement = _SETTLEMENT_CACHE.get(key)
+    if settlement is None:
+        settlement = _SETTLEMENT_CACHE[key] = Settlement._from_trusted(
+            tuple(hexes), is_city
         )
+    return settlement
+
+
+def score_settlements_bulk(hex_numbers, is_city):
+    """
+    Calculate expected resources per roll for many settlements at once.
+
+    Works on plain dice numbers instead of Settlement objects, so callers
+    scoring every placement on a board can skip building settlements.
+    Padding slots should hold 0, which has probability 0.0.
+
+    Args:
+        hex_numbers (list): One sequence of dice numbers per settlement
+        is_city (list): One bool per settlement
+
+    Returns:
+        list: Expected resources per roll, one float per settlement
+
+    Example:
+        >>> score_settlements_bulk([(6, 8, 0), (6, 0, 0)], [False, True])
+        [0.2778, 0.2778]
+    """
+    prob = ROLL_PROB_TABLE.__getitem__
+    return [
+        sum(map(prob, numbers)) * (2 if city else 1)
+        for numbers, city in zip(hex_numbers, is_city)
+    ]
+
+
+def score_from_arrays(hex_numbers, resource_ids, is_city):
+    """
+    Calculate all three metrics for many settlements without objects.
+
+    Rows describe settlements by their dice numbers and Resource codes,
+    so search code can score candidate placements without building
+    HexTile or Settlement objects. Inputs are not validated. Padding
+    slots should hold number 0 and Resource.DESERT (0).
+
+    Args:
+        hex_numbers (list): One sequence of dice numbers per settlement
+        resource_ids (list): One sequence of Resource codes per
+                             settlement, aligned with hex_numbers
+        is_city (list): One bool per settlement
+
+    Returns:
+        tuple: (expected, weighted, probability) lists, one float per
+               settlement for each metric, matching Settlement.score()
+
+    Example:
+        >>> score_from_arrays(
+        ...     [(6, 8, 0)], [(Resource.WOOD, Resource.BRICK, 0)], [False]
+        ... )
+        ([0.2778], [0.3928], [0.2778])
+    """
+    prob = ROLL_PROB_TABLE.__getitem__
+    expected = []
+    weighted = []
+    probability = []
+    rows = zip(hex_numbers, resource_ids, is_city)
+    for numbers, resources, city in rows:
+        number_mask = 0
+        for number in numbers:
+            number_mask |= _NUMBER_BITS[number]
+        resource_mask = 0
+        for resource_id in resources:
+            resource_mask |= _RESOURCE_BITS[resource_id]
 
-        return total_probability
\ No newline at end of file
+        total = sum(map(prob, numbers)) * (2 if city else 1)
+        expected.append(total)
+        weighted.append(total * _DIVERSITY_BY_MASK[resource_mask])
+        probability.append(_MASK_TO_PROB[number_mask])
+    return expected, weighted, probability
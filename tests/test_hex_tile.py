@@ -1,7 +1,10 @@
 """Tests for HexTile class."""
 
+import copy
+import pickle
 import unittest
-from catan_tracker import HexTile
+from catan_tracker import HexTile, Resource
+from catan_tracker.hex_tile import _HEX_CACHE
 
 
 class TestHexTileCreation(unittest.TestCase):
@@ -24,45 +27,154 @@ class TestHexTileCreation(unittest.TestCase):
         self.assertEqual(desert.resource, 'desert')
         self.assertEqual(desert.number, 0)
 
+    def test_str_subclass_resource(self):
+        """Test a str subclass resource is stored as a plain str."""
+        class Name(str):
+            pass
+
+        hex_tile = HexTile(Name('sheep'), 11)
+        self.assertIs(type(hex_tile.resource), str)
+        self.assertEqual(hex_tile.resource, 'sheep')
+        self.assertIs(HexTile(Name('Brick'), 3), HexTile('brick', 3))
+
+    def test_resource_member(self):
+        """Test a Resource member is accepted in place of its name."""
+        hex_tile = HexTile(Resource.WOOD, 6)
+        self.assertEqual(hex_tile.resource, 'wood')
+        self.assertIs(type(hex_tile.resource), str)
+        self.assertIs(hex_tile, HexTile('wood', 6))
+        self.assertEqual(HexTile(Resource.DESERT, 0).resource_id, 0)
+
+    def test_resource_id(self):
+        """Test the resource integer code is stored."""
+        self.assertIs(HexTile('Wheat', 9).resource_id, Resource.WHEAT)
+        self.assertEqual(HexTile('desert', 0).resource_id, 0)
+
+    def test_probability_value(self):
+        """Test the roll probability is stored on the tile."""
+        self.assertAlmostEqual(HexTile('wood', 6).probability_value, 5 / 36)
+        self.assertEqual(HexTile('desert', 0).probability_value, 0.0)
+
+    def test_resource_bit(self):
+        """Test each producing resource has its own bit and desert none."""
+        bits = {HexTile(r, 6).resource_bit
+                for r in ('wood', 'brick', 'sheep', 'wheat', 'ore')}
+        self.assertEqual(bits, {1, 2, 4, 8, 16})
+        self.assertEqual(HexTile('desert', 0).resource_bit, 0)
+
+    def test_number_bit(self):
+        """Test number bits start at 2 and desert has none."""
+        self.assertEqual(HexTile('wood', 2).number_bit, 1)
+        self.assertEqual(HexTile('wood', 12).number_bit, 1 << 10)
+        self.assertEqual(HexTile('desert', 0).number_bit, 0)
+
     def test_repr(self):
         """Test string representation."""
         hex_tile = HexTile('wood', 6)
         self.assertEqual(repr(hex_tile), "HexTile('wood', 6)")
 
+    def test_no_instance_dict(self):
+        """Test hex tiles use slots instead of a per-instance dict."""
+        hex_tile = HexTile('wood', 6)
+        self.assertFalse(hasattr(hex_tile, '__dict__'))
+
+
+class TestHexTileSharing(unittest.TestCase):
+    """Test shared tiles and value equality."""
+
+    def test_constructor_returns_shared_instance(self):
+        """Test constructing the same tile twice gives one instance."""
+        self.assertIs(HexTile('wood', 6), HexTile('wood', 6))
+        self.assertIs(HexTile('Wood', 6), HexTile('wood', 6))
+
+    def test_other_spellings_not_cached(self):
+        """Test other spellings share the tile without new cache entries."""
+        hex_tile = HexTile('brick', 6)
+        size = len(_HEX_CACHE)
+        self.assertIs(HexTile('BRICK', 6), hex_tile)
+        self.assertIs(HexTile('bRiCk', 6), hex_tile)
+        self.assertEqual(len(_HEX_CACHE), size)
+
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
+    def test_constructor_float_not_shared(self):
+        """Test a float number still raises after the int tile is cached."""
+        HexTile('wood', 6)
+        with self.assertRaises(ValueError):
+            HexTile('wood', 6.0)
+
+    def test_shared_tile_is_immutable(self):
+        """Test assigning to a shared tile raises and leaves it unchanged."""
+        hex_tile = HexTile('wood', 6)
+        with self.assertRaises(AttributeError):
+            hex_tile.number = 8
+        with self.assertRaises(AttributeError):
+            del hex_tile.resource
+        self.assertEqual(HexTile('wood', 6).number, 6)
+
+    def test_copy_and_pickle(self):
+        """Test copies and unpickled tiles are equal to the original."""
+        hex_tile = HexTile('sheep', 10)
+        self.assertEqual(copy.copy(hex_tile), hex_tile)
+        self.assertEqual(copy.deepcopy(hex_tile), hex_tile)
+        self.assertEqual(pickle.loads(pickle.dumps(hex_tile)), hex_tile)
+
+    def test_equality(self):
+        """Test tiles with the same resource and number are equal."""
+        self.assertEqual(HexTile('wood', 6), HexTile('wood', 6))
+        self.assertNotEqual(HexTile('wood', 6), HexTile('wood', 8))
+        self.assertNotEqual(HexTile('wood', 6), HexTile('brick', 6))
+
+    def test_hashable(self):
+        """Test equal tiles collapse in a set."""
+        tiles = {HexTile('wood', 6), HexTile('wood', 6), HexTile('ore', 8)}
+        self.assertEqual(len(tiles), 2)
+
 
 class TestHexTileValidation(unittest.TestCase):
     """Test HexTile input validation."""
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
     def test_invalid_resource(self):
         """Test invalid resource type raises ValueError."""
         with self.assertRaises(ValueError) as cm:
             HexTile('gold', 6)
         self.assertIn('Invalid resource', str(cm.exception))
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
     def test_number_too_high(self):
         """Test number > 12 raises ValueError."""
         with self.assertRaises(ValueError) as cm:
             HexTile('wood', 13)
         self.assertIn('must be 0-12', str(cm.exception))
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
     def test_number_negative(self):
         """Test negative number raises ValueError."""
         with self.assertRaises(ValueError) as cm:
             HexTile('wood', -1)
         self.assertIn('must be 0-12', str(cm.exception))
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
     def test_number_is_seven(self):
         """Test number 7 raises ValueError."""
         with self.assertRaises(ValueError) as cm:
             HexTile('wood', 7)
         self.assertIn('cannot be 7', str(cm.exception))
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
     def test_number_not_integer(self):
         """Test non-integer number raises ValueError."""
         with self.assertRaises(ValueError) as cm:
             HexTile('wood', 6.5)
         self.assertIn('must be an integer', str(cm.exception))
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
+    def test_integral_float_rejected(self):
+        """Test a float equal to a valid number still raises ValueError."""
+        with self.assertRaises(ValueError) as cm:
+            HexTile('wood', 6.0)
+        self.assertIn('must be an integer', str(cm.exception))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Tests for probabilities module."""
 
 import unittest
-from catan_tracker.probabilities import ROLL_PROBABILITIES
+from catan_tracker.probabilities import (
+    ROLL_PROBABILITIES, ROLL_PROB_TABLE, validate_probabilities
+)
 
 
 class TestProbabilities(unittest.TestCase):
@@ -12,6 +14,10 @@ class TestProbabilities(unittest.TestCase):
         total = sum(ROLL_PROBABILITIES.values())
         self.assertAlmostEqual(total, 1.0, places=10)
 
+    def test_validate_probabilities(self):
+        """Verify the module's own consistency check passes."""
+        self.assertTrue(validate_probabilities())
+
     def test_all_numbers_present(self):
         """Verify all numbers 2-12 are in dictionary."""
         expected_numbers = set(range(2, 13))
@@ -32,6 +38,29 @@ class TestProbabilities(unittest.TestCase):
         self.assertEqual(ROLL_PROBABILITIES[5], ROLL_PROBABILITIES[9])
         self.assertEqual(ROLL_PROBABILITIES[6], ROLL_PROBABILITIES[8])
 
+    def test_read_only(self):
+        """Verify the dictionary can't be modified."""
+        with self.assertRaises(TypeError):
+            ROLL_PROBABILITIES[2] = 0.5
+
+
+class TestProbabilityTable(unittest.TestCase):
+    """Test the tuple form of the probability distribution."""
+
+    def test_table_length(self):
+        """Verify table is indexable by every number 0-12."""
+        self.assertEqual(len(ROLL_PROB_TABLE), 13)
+
+    def test_table_matches_dictionary(self):
+        """Verify table entries match the dictionary."""
+        for number, prob in ROLL_PROBABILITIES.items():
+            self.assertEqual(ROLL_PROB_TABLE[number], prob)
+
+    def test_unrollable_numbers_are_zero(self):
+        """Verify desert (0) and 1 have zero probability."""
+        self.assertEqual(ROLL_PROB_TABLE[0], 0.0)
+        self.assertEqual(ROLL_PROB_TABLE[1], 0.0)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
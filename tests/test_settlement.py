@@ -2,7 +2,10 @@
 
 import unittest
 import math
-from catan_tracker import HexTile, Settlement, ROLL_PROBABILITIES
+from catan_tracker import (
+    HexTile, Resource, Settlement, ROLL_PROBABILITIES, make_settlement,
+    score_settlements_bulk, score_from_arrays
+)
 
 
 class TestSettlementCreation(unittest.TestCase):
@@ -13,6 +16,7 @@ class TestSettlementCreation(unittest.TestCase):
         hexes = [HexTile('wood', 6), HexTile('brick', 8)]
         settlement = Settlement(hexes)
         self.assertEqual(len(settlement.hexes), 2)
+        self.assertEqual(settlement.hexes, tuple(hexes))
         self.assertFalse(settlement.is_city)
         self.assertEqual(settlement.multiplier, 1)
 
@@ -35,16 +39,32 @@ class TestSettlementCreation(unittest.TestCase):
         city = Settlement(hexes, is_city=True)
         self.assertEqual(repr(city), "City(1 hexes)")
 
+    def test_from_trusted_matches_constructor(self):
+        """Test a trusted settlement has the same data and metrics."""
+        hexes = (HexTile('wood', 6), HexTile('brick', 8))
+        trusted = Settlement._from_trusted(hexes, is_city=True)
+        settlement = Settlement(list(hexes), is_city=True)
+        self.assertEqual(trusted.hexes, settlement.hexes)
+        self.assertEqual(trusted.multiplier, 2)
+        self.assertEqual(trusted.score(), settlement.score())
+
+    def test_no_instance_dict(self):
+        """Test settlements use slots instead of a per-instance dict."""
+        settlement = Settlement([HexTile('wood', 6)])
+        self.assertFalse(hasattr(settlement, '__dict__'))
+
 
 class TestSettlementValidation(unittest.TestCase):
     """Test Settlement input validation."""
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
     def test_empty_hexes(self):
         """Test empty hex list raises ValueError."""
         with self.assertRaises(ValueError) as cm:
             Settlement([])
         self.assertIn('must touch 1-3 hexes', str(cm.exception))
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
     def test_too_many_hexes(self):
         """Test more than 3 hexes raises ValueError."""
         hexes = [
@@ -57,12 +77,20 @@ class TestSettlementValidation(unittest.TestCase):
             Settlement(hexes)
         self.assertIn('must touch 1-3 hexes', str(cm.exception))
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
     def test_invalid_hex_type(self):
         """Test non-HexTile objects raise ValueError."""
         with self.assertRaises(ValueError) as cm:
             Settlement(['wood', 'brick'])
         self.assertIn('must be HexTile objects', str(cm.exception))
 
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
+    def test_invalid_hex_type_reports_index(self):
+        """Test the error names the first non-HexTile item."""
+        with self.assertRaises(ValueError) as cm:
+            Settlement([HexTile('wood', 6), 'brick'])
+        self.assertIn('Item 1 is str', str(cm.exception))
+
 
 class TestExpectedResources(unittest.TestCase):
     """Test expected_resources_per_roll method."""
@@ -206,6 +234,14 @@ class TestProbabilityOfResources(unittest.TestCase):
         prob = settlement.probability_of_resources_on_roll()
         self.assertAlmostEqual(prob, ROLL_PROBABILITIES[6], places=4)
 
+    def test_extreme_numbers(self):
+        """Test probability for the lowest and highest numbers."""
+        hexes = [HexTile('wood', 2), HexTile('brick', 12)]
+        settlement = Settlement(hexes)
+        prob = settlement.probability_of_resources_on_roll()
+        expected = ROLL_PROBABILITIES[2] + ROLL_PROBABILITIES[12]
+        self.assertAlmostEqual(prob, expected, places=10)
+
     def test_city_same_probability_as_settlement(self):
         """Test city has same probability as settlement."""
         hexes = [HexTile('wood', 6), HexTile('brick', 8)]
@@ -218,5 +254,132 @@ class TestProbabilityOfResources(unittest.TestCase):
         self.assertAlmostEqual(settlement_prob, city_prob, places=4)
 
 
+class TestScore(unittest.TestCase):
+    """Test the combined score method."""
+
+    def test_score_matches_individual_metrics(self):
+        """Test score() returns each metric in order."""
+        hexes = [
+            HexTile('wood', 6),
+            HexTile('wood', 6),
+            HexTile('desert', 0)
+        ]
+        settlement = Settlement(hexes, is_city=True)
+        self.assertEqual(settlement.score(), (
+            settlement.expected_resources_per_roll(),
+            settlement.expected_resources_weighted_by_diversity(),
+            settlement.probability_of_resources_on_roll(),
+        ))
+
+
+class TestMakeSettlement(unittest.TestCase):
+    """Test shared settlements from make_settlement."""
+
+    def test_same_hexes_any_order_shared(self):
+        """Test the same hexes in any order give the same instance."""
+        first = make_settlement([HexTile('wood', 6), HexTile('ore', 8)])
+        second = make_settlement([HexTile('ore', 8), HexTile('wood', 6)])
+        self.assertIs(first, second)
+
+    def test_city_not_shared_with_settlement(self):
+        """Test a city and a settlement on the same hexes differ."""
+        hexes = [HexTile('wood', 6)]
+        settlement = make_settlement(hexes)
+        city = make_settlement(hexes, is_city=True)
+        self.assertIsNot(settlement, city)
+        self.assertTrue(city.is_city)
+
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
+    def test_invalid_hexes_raise(self):
+        """Test invalid input raises the usual ValueError."""
+        with self.assertRaises(ValueError):
+            make_settlement(['wood'])
+        with self.assertRaises(ValueError):
+            make_settlement([])
+
+    @unittest.skipUnless(__debug__, "validation is skipped under -O")
+    def test_tuple_rejected_even_when_cached(self):
+        """Test a tuple of hexes raises even if the list form is cached."""
+        hexes = [HexTile('wheat', 5), HexTile('sheep', 9)]
+        # Hold a reference so the list form stays in the weak cache
+        cached = make_settlement(hexes)
+        with self.assertRaises(ValueError):
+            make_settlement(tuple(hexes))
+
+    def test_is_city_stored_as_bool(self):
+        """Test a truthy is_city is normalized to True."""
+        city = make_settlement([HexTile('ore', 10)], is_city=1)
+        self.assertIs(city.is_city, True)
+        again = make_settlement([HexTile('ore', 10)], is_city=True)
+        self.assertIs(again, city)
+
+
+class TestBulkScoring(unittest.TestCase):
+    """Test to_array and score_settlements_bulk."""
+
+    def test_to_array_pads_rows(self):
+        """Test rows are padded with 0 to three numbers."""
+        settlements = [
+            Settlement([HexTile('wood', 6)]),
+            Settlement(
+                [HexTile('wood', 6), HexTile('brick', 8)], is_city=True
+            ),
+        ]
+        hex_numbers, is_city = Settlement.to_array(settlements)
+        self.assertEqual(hex_numbers, [(6, 0, 0), (6, 8, 0)])
+        self.assertEqual(is_city, [False, True])
+
+    def test_bulk_matches_per_settlement(self):
+        """Test bulk scores match expected_resources_per_roll."""
+        settlements = [
+            Settlement([HexTile('wood', 6), HexTile('brick', 8)]),
+            Settlement([HexTile('wheat', 9), HexTile('desert', 0)]),
+            Settlement(
+                [HexTile('ore', 5), HexTile('sheep', 10), HexTile('wood', 3)],
+                is_city=True
+            ),
+        ]
+        scores = score_settlements_bulk(*Settlement.to_array(settlements))
+        self.assertEqual(len(scores), len(settlements))
+        for score, settlement in zip(scores, settlements):
+            self.assertAlmostEqual(
+                score, settlement.expected_resources_per_roll(), places=10
+            )
+
+    def test_score_from_arrays_matches_score(self):
+        """Test array scoring matches score() for each settlement."""
+        hex_numbers = [(6, 6, 0), (8, 9, 4), (2, 0, 0)]
+        resource_ids = [
+            (Resource.WOOD, Resource.SHEEP, Resource.DESERT),
+            (Resource.ORE, Resource.ORE, Resource.WHEAT),
+            (Resource.BRICK, 0, 0),
+        ]
+        is_city = [False, True, False]
+        settlements = [
+            Settlement([HexTile('wood', 6), HexTile('sheep', 6),
+                        HexTile('desert', 0)]),
+            Settlement([HexTile('ore', 8), HexTile('ore', 9),
+                        HexTile('wheat', 4)], is_city=True),
+            Settlement([HexTile('brick', 2)]),
+        ]
+        metrics = score_from_arrays(
+            hex_numbers, resource_ids, is_city
+        )
+        for i, settlement in enumerate(settlements):
+            for column, value in zip(metrics, settlement.score()):
+                self.assertAlmostEqual(column[i], value, places=10)
+
+    def test_score_from_arrays_wide_rows(self):
+        """Test rows with more than three resources are scored."""
+        expected, weighted, _ = score_from_arrays(
+            [(2, 3, 4, 5, 6)], [(1, 2, 3, 4, 5)], [False]
+        )
+        self.assertAlmostEqual(weighted[0], expected[0] * math.sqrt(5))
+
+    def test_bulk_empty(self):
+        """Test bulk scoring of no settlements."""
+        self.assertEqual(score_settlements_bulk([], []), [])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file